@@ -1,12 +1,74 @@
 import os
 import csv
+import atexit
+import bisect
+import hashlib
+import math
+import pickle
 import platform
+import re
 import shutil
-import subprocess  # needed for clipboard copying via xclip
+import tempfile
+import subprocess  # needed for clipboard copying via xclip / wl-copy
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 
+# matplotlib is optional and only needed for "Show Distribution"; importing it
+# here keeps its import cost off the first click
+try:
+    import matplotlib
+
+    matplotlib.use("TkAgg")
+    import matplotlib.pyplot as _plt
+    import numpy as np
+except ImportError:
+    _plt = None
+
+# Cropped track images are kept downscaled to this size, in memory and on disk
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "age-gender-annotator")
+CACHE_MAX_SIDE = 400
+CACHE_MAX_ENTRIES = 512
+# Files kept in CACHE_DIR; the least recently used ones are pruned at startup
+CACHE_DISK_MAX_ENTRIES = 20000
+# Tracks decoded in the background relative to the current one
+PREFETCH_OFFSETS = (1, 2, -1)
+# Resampling filter for all thumbnail scaling
+THUMB_RESAMPLE = Image.Resampling.BILINEAR
+
+# Track image file names, and the crop box encoded in them as
+# "<prefix>_<...>_<left>_<top>_<right>_<bottom>.<ext>"
+_IMG_RE = re.compile(r".+\.(jpe?g|png)", re.IGNORECASE).fullmatch
+_NUM = r"(-?\d+(?:\.\d+)?)"
+_BBOX_RE = re.compile(rf"[^_]*_.*_{_NUM}_{_NUM}_{_NUM}_{_NUM}\.[^.]+$").match
+
+# Delay before checking whether the clipboard helper failed
+CLIPBOARD_CHECK_MS = 300
+
+# Mosaic PhotoImages kept around for reuse, keyed by size
+PHOTO_POOL_SIZE = 4
+
+
+def _parse_bbox(filename):
+    """
+    Returns the (left, top, right, bottom) crop box encoded at the end of an
+    image file name such as "frame_000123_10_20_110_220.jpg", or None.
+    """
+    m = _BBOX_RE(filename)
+    return tuple(map(float, m.groups())) if m else None
+
+
+def _parse_age(age_str):
+    """Returns age_str as a float, or NaN if it is not a number."""
+    try:
+        return float(age_str)
+    except ValueError:
+        return math.nan
+
 
 class NumericEntry(ttk.Entry):
     """
@@ -37,18 +99,50 @@ class LabelingTool(tk.Tk):
         self.output_csv = output_csv
 
         # Collect tracks
-        self.tracks = self._get_tracks(root_folder)
+        self.tracks = self._load_tracks(root_folder)
         self.n_tracks = len(self.tracks)
 
         # Load partial labels
         self.labeled_data = self._load_existing_labels(self.output_csv)
+        # Progress-bar color of every labeled track, kept in sync on save/remove
+        self._track_color = {
+            key: self._label_color(age) for key, (_, age) in self.labeled_data.items()
+        }
 
         self.current_track_index = 0
 
-        if not os.path.isfile(self.output_csv):
+        # An empty file (touched, or truncated by a crash mid-rewrite) needs
+        # the header too, or the first appended label is read back as one
+        if not os.path.isfile(self.output_csv) or os.path.getsize(self.output_csv) == 0:
             with open(self.output_csv, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(["camera_id", "track_id", "gender", "age"])
+        else:
+            # A hand-edited file may lack the final line break, which would
+            # glue the first appended row onto its last line
+            with open(self.output_csv, "rb+") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) not in (b"\n", b"\r"):
+                    f.write(b"\r\n")
+
+        # Labels are appended one row at a time; re-saving an already labeled
+        # track appends a newer row (later rows win on load) and the file is
+        # consolidated on exit.
+        self._csv_fh = open(self.output_csv, "a", newline="", encoding="utf-8")
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_dirty = False
+        atexit.register(self._close_csv)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # "Show Distribution" figure, created on first use and then redrawn
+        self._dist_fig = None
+        self._dist_axes = None
+
+        # Clipboard helper: wl-copy on Wayland, xclip otherwise
+        self._use_wl_copy = bool(os.environ.get("WAYLAND_DISPLAY")) and bool(
+            shutil.which("wl-copy")
+        )
+        self._xclip_proc = None
 
         # ----- Styles for "Save & Next" -----
         self.style = ttk.Style(self)
@@ -78,7 +172,12 @@ class LabelingTool(tk.Tk):
         self.progress_canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.progress_canvas.bind("<Button-1>", self._on_progress_click)
         self.progress_canvas.bind("<Configure>", self._on_progress_canvas_configure)
-        self.track_rects = []
+        # Canvas item id of each track's rectangle, so single cells can be
+        # recolored without redrawing the whole bar
+        self._rect_by_index = []
+        self._progress_marked_index = None
+        self._progress_redraw_pending = False
+        self._last_progress_size = None
 
         # "Go to Track" spinbox + button
         self.goto_frame = ttk.Frame(self.nav_frame)
@@ -118,11 +217,12 @@ class LabelingTool(tk.Tk):
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.v_scrollbar.config(command=self.canvas.yview)
 
-        self.images_frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window(
-            (0, 0), window=self.images_frame, anchor="nw"
-        )
+        # All thumbnails of a track are composited into one image on this item
+        self.mosaic_item = self.canvas.create_image(0, 0, anchor="nw")
         self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._reflow_pending = False
+        self._last_canvas_width = None
+        self.canvas.bind("<Button-1>", self._on_image_click)
 
         # =============================
         #   BOTTOM FRAME: gender/age + nav
@@ -179,8 +279,26 @@ class LabelingTool(tk.Tk):
         self.save_next_button.pack(side=tk.RIGHT, padx=5)
 
         self.original_images = []
-        self.img_labels = []
-        self.img_tks = []
+        self.selected_indices = set()
+        self.mosaic_tk = None
+        self._photo_pool = OrderedDict()
+        # (cols, cell_width, y_offsets, scaled_sizes) of the current mosaic
+        self._mosaic_layout = None
+        # Thumbnails of the last reflow, parallel to original_images
+        self._scaled_images = []
+        self._last_cell_width = None
+
+        # (path, mtime) -> cropped and downscaled PIL image, in LRU order.
+        # Shared with the prefetch threads, hence the lock.
+        self._img_cache = OrderedDict()
+        self._img_cache_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_pool.submit(self._prune_disk_cache)
+        # Decodes the images of the displayed track; PIL releases the GIL
+        self._decode_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._prefetch_futures = []
+        # Bumped to stop prefetches that are already running
+        self._prefetch_generation = 0
 
         # Enable/Disable Save & Next
         self.age_var.trace_add("write", self._update_save_button_state)
@@ -221,16 +339,13 @@ class LabelingTool(tk.Tk):
         self.bind("<Delete>", self._delete_selected_images)
 
     def _delete_selected_images(self, event):
-        indices_to_remove = [
-            i
-            for i, lbl in enumerate(self.img_labels)
-            if getattr(lbl, "selected", False)
-        ]
+        indices_to_remove = list(self.selected_indices)
         if not indices_to_remove:
             return
 
         for index in sorted(indices_to_remove, reverse=True):
             file_path = self.image_paths[index]
+            self._forget_cached_image(file_path)
             try:
                 os.remove(file_path)
                 print(f"Deleted file: {file_path}")
@@ -239,10 +354,11 @@ class LabelingTool(tk.Tk):
 
             del self.original_images[index]
             del self.image_paths[index]
-            lbl = self.img_labels.pop(index)
-            lbl.destroy()
-            del self.img_tks[index]
+            del self._scaled_images[index]
 
+        self.selected_indices.clear()
+        self._last_cell_width = None
+        self._invalidate_track_index()
         self._flow_images()
 
     def _shortcut_male(self, event):
@@ -294,8 +410,11 @@ class LabelingTool(tk.Tk):
         if not (0 <= self.current_track_index < self.n_tracks):
             return
 
-        camera_id, track_id, _ = self.tracks[self.current_track_index]
+        self._cancel_prefetch()
+        camera_id, track_id, images = self.tracks[self.current_track_index]
         track_dir = os.path.join(self.root_folder, camera_id, track_id)
+        for path, _ in images:
+            self._forget_cached_image(path)
         try:
             shutil.rmtree(track_dir)
             print(f"Deleted track directory: {track_dir}")
@@ -304,17 +423,16 @@ class LabelingTool(tk.Tk):
                 "Error", f"Failed to delete track directory:\n{track_dir}\n{str(e)}"
             )
             return
+        self._invalidate_track_index()
 
         del self.tracks[self.current_track_index]
         self.n_tracks = len(self.tracks)
+        self._draw_progress_bar()
 
         if (camera_id, track_id) in self.labeled_data:
             del self.labeled_data[(camera_id, track_id)]
-            with open(self.output_csv, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["camera_id", "track_id", "gender", "age"])
-                for (c, t), (g, a) in self.labeled_data.items():
-                    writer.writerow([c, t, g, a])
+            del self._track_color[(camera_id, track_id)]
+            self._rewrite_csv()
 
         if self.current_track_index >= self.n_tracks:
             self.current_track_index = self.n_tracks - 1
@@ -331,48 +449,142 @@ class LabelingTool(tk.Tk):
     # ------------------------------
     def copy_image_to_clipboard(self, image_path):
         """
-        Uses xclip to copy the image at image_path to the clipboard.
-        Assumes the image is in PNG format (or a compatible format).
+        Uses xclip (or wl-copy on Wayland) to copy the image at image_path to
+        the clipboard. Assumes the image is in PNG format (or a compatible
+        format). The helper keeps running in the background to serve the
+        selection, so it is started without waiting on it and checked a
+        moment later; a previous helper still holding the clipboard is
+        terminated first.
         """
+        if self._xclip_proc is not None and self._xclip_proc.poll() is None:
+            self._xclip_proc.terminate()
         try:
-            subprocess.run(
-                [
-                    "xclip",
-                    "-selection",
-                    "clipboard",
-                    "-t",
-                    "image/png",
-                    "-i",
-                    image_path,
-                ],
-                check=True,
-            )
-            print(f"Copied {image_path} to clipboard.")
-        except subprocess.CalledProcessError as e:
+            if self._use_wl_copy:
+                with open(image_path, "rb") as f:
+                    self._xclip_proc = subprocess.Popen(
+                        ["wl-copy", "--type", "image/png"],
+                        stdin=f,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+            else:
+                self._xclip_proc = subprocess.Popen(
+                    [
+                        "xclip",
+                        "-selection",
+                        "clipboard",
+                        "-t",
+                        "image/png",
+                        "-i",
+                        image_path,
+                    ],
+                    stdin=None,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+        except OSError as e:
+            self._xclip_proc = None
             messagebox.showerror(
                 "Clipboard Error", f"Failed to copy image to clipboard.\n{e}"
             )
+            return
+        self.after(CLIPBOARD_CHECK_MS, self._check_clipboard_helper, self._xclip_proc)
+
+    def _check_clipboard_helper(self, proc):
+        # A helper that already exited non-zero failed (e.g. no display); one
+        # replaced by a newer copy was terminated by us and is not an error
+        if proc is not self._xclip_proc:
+            return
+        returncode = proc.poll()
+        if returncode is not None and returncode != 0:
+            messagebox.showerror(
+                "Clipboard Error",
+                f"Failed to copy image to clipboard.\n"
+                f"{proc.args[0]} exited with status {returncode}.",
+            )
 
     # ==========================
     #   DATA LOADING
     # ==========================
+    def _track_index_path(self):
+        digest = hashlib.sha1(
+            os.path.abspath(self.root_folder).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(CACHE_DIR, f"index-{digest}.pkl")
+
+    def _tree_signature(self, root_folder):
+        """
+        mtimes of the root folder and of every camera and track folder in it.
+        Adding or removing an image changes its track folder's mtime, so this
+        covers the image lists without listing every track's files.
+        """
+        with os.scandir(root_folder) as it:
+            cam_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        cameras = []
+        for cam_entry in cam_entries:
+            with os.scandir(cam_entry.path) as it:
+                tracks = sorted(
+                    (e.name, e.stat().st_mtime_ns) for e in it if e.is_dir()
+                )
+            cameras.append((cam_entry.name, cam_entry.stat().st_mtime_ns, tracks))
+        return os.stat(root_folder).st_mtime_ns, cameras
+
+    def _load_tracks(self, root_folder):
+        """
+        Returns the tracks of root_folder from the sidecar index in CACHE_DIR
+        while the root, camera and track folders are unchanged, and rescans
+        (and rewrites the index) otherwise.
+        """
+        index_path = self._track_index_path()
+        signature = self._tree_signature(root_folder)
+        try:
+            with open(index_path, "rb") as f:
+                cached_signature, tracks = pickle.load(f)
+            if cached_signature == signature:
+                return tracks
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: ignoring unreadable track index {index_path}: {e}")
+
+        tracks = self._get_tracks(root_folder)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(index_path, "wb") as f:
+                pickle.dump((signature, tracks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: could not write track index {index_path}: {e}")
+        return tracks
+
+    def _invalidate_track_index(self):
+        try:
+            os.remove(self._track_index_path())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: could not remove track index: {e}")
+
     def _get_tracks(self, root_folder):
         tracks = []
-        for camera_id in sorted(os.listdir(root_folder)):
-            cam_path = os.path.join(root_folder, camera_id)
-            if not os.path.isdir(cam_path):
+        with os.scandir(root_folder) as it:
+            cam_entries = sorted(it, key=lambda e: e.name)
+        for cam_entry in cam_entries:
+            if not cam_entry.is_dir():
                 continue
-            for track_id in sorted(os.listdir(cam_path)):
-                track_path = os.path.join(cam_path, track_id)
-                if not os.path.isdir(track_path):
+            with os.scandir(cam_entry.path) as it:
+                track_entries = sorted(it, key=lambda e: e.name)
+            for track_entry in track_entries:
+                if not track_entry.is_dir():
                     continue
-                image_paths = [
-                    os.path.join(track_path, f)
-                    for f in sorted(os.listdir(track_path))
-                    if f.lower().endswith((".jpg", ".jpeg", ".png"))
+                with os.scandir(track_entry.path) as it:
+                    file_names = sorted(e.name for e in it if _IMG_RE(e.name))
+                # (path, crop box or None), parsed once here
+                images = [
+                    (os.path.join(track_entry.path, f), _parse_bbox(f))
+                    for f in file_names
                 ]
-                if image_paths:
-                    tracks.append((camera_id, track_id, image_paths))
+                if images:
+                    tracks.append((cam_entry.name, track_entry.name, images))
         return tracks
 
     def _load_existing_labels(self, csv_path):
@@ -395,20 +607,22 @@ class LabelingTool(tk.Tk):
     #   DISPLAY / LAYOUT
     # ==========================
     def display_current_track(self):
+        # Stop warming the old neighbourhood before decoding the new track
+        self._cancel_prefetch()
         self.goto_spin.config(to=self.n_tracks if self.n_tracks > 0 else 1)
-        for lbl in self.img_labels:
-            lbl.destroy()
-        self.img_labels.clear()
-        self.img_tks.clear()
         self.original_images.clear()
+        self.selected_indices.clear()
+        self._scaled_images.clear()
+        self._last_cell_width = None
 
         if not (0 <= self.current_track_index < self.n_tracks):
             self.title_label.config(
                 text="No Tracks Found" if self.n_tracks == 0 else "Out of range"
             )
+            self._flow_images()
             return
 
-        camera_id, track_id, img_paths = self.tracks[self.current_track_index]
+        camera_id, track_id, images = self.tracks[self.current_track_index]
 
         self.title_label.config(
             text=f"Camera: {camera_id} | Track: {track_id}   "
@@ -425,61 +639,230 @@ class LabelingTool(tk.Tk):
 
         self.image_paths = []
 
-        for path in img_paths:
-            try:
-                pil_img = Image.open(path)
-                basename = os.path.basename(path)
-                parts = basename.split("_")
-                if len(parts) >= 6:
-                    try:
-                        parts[-1] = os.path.splitext(parts[-1])[0]
-                        left = float(parts[-4])
-                        top = float(parts[-3])
-                        right = float(parts[-2])
-                        bottom = float(parts[-1])
-                        pil_img = pil_img.crop((left, top, right, bottom))
-                    except Exception as e:
-                        print(f"Error cropping image {basename}: {e}")
+        # map() keeps the results in the order of the track's images
+        for path, pil_img in self._decode_pool.map(self._open_and_crop, images):
+            if pil_img is not None:
                 self.original_images.append(pil_img)
                 self.image_paths.append(path)
-            except Exception as e:
-                print(f"Warning: could not open {path}: {e}")
-
-        # Create placeholders and attach file path to each label
-        for i, pil_img in enumerate(self.original_images):
-            thumb = pil_img.copy()
-            thumb.thumbnail((200, 200), Image.Resampling.LANCZOS)
-            imgtk = ImageTk.PhotoImage(thumb)
-            lbl = ttk.Label(self.images_frame, image=imgtk)
-            lbl.image = imgtk
-            lbl.selected = False
-            lbl.file_path = self.image_paths[i]
-            # Modified: Bind image click to toggle selection and copy image to clipboard
-            lbl.bind("<Button-1>", self._on_image_click)
-            lbl.pack()
-            self.img_labels.append(lbl)
-            self.img_tks.append(imgtk)
 
         self.update_idletasks()
         self._flow_images()
-        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.canvas.yview_moveto(0)
         self._update_save_button_state()
-        self._draw_progress_bar()
+        self._update_progress_marker()
+        self._schedule_prefetch()
+
+    def _cache_path(self, path, mtime):
+        digest = hashlib.sha1(f"{path}:{mtime}".encode("utf-8")).hexdigest()
+        return os.path.join(CACHE_DIR, f"{digest}.jpg")
+
+    def _load_cropped_image(self, path, bbox):
+        """
+        Returns the image at path, cropped to bbox and downscaled. Looks in
+        the in-memory LRU cache first, then in the on-disk cache, and only
+        decodes and crops the original file on a miss or an unreadable cache
+        entry.
+        """
+        key = (path, os.path.getmtime(path))
+        with self._img_cache_lock:
+            pil_img = self._img_cache.get(key)
+            if pil_img is not None:
+                self._img_cache.move_to_end(key)
+                return pil_img
+
+        cache_path = self._cache_path(*key)
+        pil_img = None
+        if os.path.isfile(cache_path):
+            try:
+                pil_img = Image.open(cache_path)
+                pil_img.load()
+                # Marks the entry as recently used for _prune_disk_cache
+                os.utime(cache_path)
+            except Exception as e:
+                print(f"Warning: dropping unreadable cache file {cache_path}: {e}")
+                pil_img = None
+                self._remove_cache_file(cache_path)
+        if pil_img is None:
+            pil_img = self._decode_cropped_image(path, bbox)
+            self._write_cache_file(pil_img, cache_path)
+
+        with self._img_cache_lock:
+            self._img_cache[key] = pil_img
+            if len(self._img_cache) > CACHE_MAX_ENTRIES:
+                self._img_cache.popitem(last=False)
+        return pil_img
+
+    def _decode_cropped_image(self, path, bbox):
+        pil_img = Image.open(path)
+        if pil_img.format == "JPEG":
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale as long as the
+            # crop still covers CACHE_MAX_SIDE
+            full_w, full_h = pil_img.size
+            if bbox is not None:
+                crop_side = max(bbox[2] - bbox[0], bbox[3] - bbox[1])
+            else:
+                crop_side = max(full_w, full_h)
+            scale = CACHE_MAX_SIDE / crop_side if crop_side > 0 else 1
+            if scale < 1:
+                pil_img.draft(
+                    "RGB",
+                    (math.ceil(full_w * scale), math.ceil(full_h * scale)),
+                )
+                factor = pil_img.size[0] / full_w
+                if bbox is not None:
+                    bbox = tuple(v * factor for v in bbox)
+        if bbox is not None:
+            pil_img = pil_img.crop(bbox)
+        pil_img = pil_img.convert("RGB")
+        pil_img.thumbnail((CACHE_MAX_SIDE, CACHE_MAX_SIDE), THUMB_RESAMPLE)
+        return pil_img
+
+    def _write_cache_file(self, pil_img, cache_path):
+        # Written to a temporary file and renamed into place, so readers
+        # (and later sessions) never see a partially written JPEG
+        tmp_path = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pil_img.save(f, format="JPEG", quality=85)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not write cache file {cache_path}: {e}")
+            if tmp_path is not None:
+                self._remove_cache_file(tmp_path)
+
+    def _remove_cache_file(self, cache_path):
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+
+    def _forget_cached_image(self, path):
+        """Drops the on-disk cache entry of an image that is about to be deleted."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        self._remove_cache_file(self._cache_path(path, mtime))
+
+    def _prune_disk_cache(self):
+        """
+        Deletes the least recently used files in CACHE_DIR beyond
+        CACHE_DISK_MAX_ENTRIES, plus temporary files left by interrupted writes.
+        Entries of deleted or modified source images age out this way.
+        """
+        try:
+            with os.scandir(CACHE_DIR) as it:
+                entries = [e for e in it if e.is_file()]
+        except OSError:
+            return
+        cached = []
+        stale_tmp_before = time.time() - 3600
+        for entry in entries:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if entry.name.endswith(".tmp"):
+                # Recent ones may still be in flight on a decode thread
+                if mtime < stale_tmp_before:
+                    self._remove_cache_file(entry.path)
+            elif entry.name.endswith(".jpg"):
+                cached.append((mtime, entry.path))
+        if len(cached) <= CACHE_DISK_MAX_ENTRIES:
+            return
+        cached.sort()
+        for _, cache_path in cached[: len(cached) - CACHE_DISK_MAX_ENTRIES]:
+            self._remove_cache_file(cache_path)
+
+    def _open_and_crop(self, image):
+        path, bbox = image
+        try:
+            return path, self._load_cropped_image(path, bbox)
+        except Exception as e:
+            print(f"Warning: could not open {path}: {e}")
+            return path, None
+
+    def _schedule_prefetch(self):
+        """Warms the image cache for the tracks the user is likely to visit next."""
+        self._cancel_prefetch()
+        for offset in PREFETCH_OFFSETS:
+            idx = self.current_track_index + offset
+            if 0 <= idx < self.n_tracks:
+                _, _, images = self.tracks[idx]
+                self._prefetch_futures.append(
+                    self._prefetch_pool.submit(
+                        self._prefetch, list(images), self._prefetch_generation
+                    )
+                )
+
+    def _cancel_prefetch(self):
+        # cancel() only drops queued work; the generation bump makes running
+        # prefetches return before their next image
+        self._prefetch_generation += 1
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures.clear()
+
+    def _prefetch(self, images, generation):
+        # Runs on a worker thread: only touches PIL and the locked cache, never Tk
+        for path, bbox in images:
+            if generation != self._prefetch_generation:
+                return
+            try:
+                self._load_cropped_image(path, bbox)
+            except Exception:
+                pass
+
+    def _image_index_at(self, event):
+        """Maps a click on the images canvas to an index into original_images."""
+        if self._mosaic_layout is None:
+            return None
+        cols, cell_width, y_offsets, scaled_sizes = self._mosaic_layout
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        col = int(x // cell_width)
+        row = bisect.bisect_right(y_offsets, y) - 1
+        if not (0 <= col < cols and 0 <= row < len(y_offsets) - 1):
+            return None
+        index = row * cols + col
+        if index >= len(scaled_sizes) or y >= y_offsets[row] + scaled_sizes[index][1]:
+            return None
+        return index
 
     def _on_image_click(self, event):
-        lbl = event.widget
-        lbl.selected = not getattr(lbl, "selected", False)
-        if lbl.selected:
-            lbl.config(borderwidth=5, relief="solid")
-            # Copy the image (using its file path) to the clipboard
-            self.copy_image_to_clipboard(lbl.file_path)
+        index = self._image_index_at(event)
+        if index is None:
+            return
+        if index in self.selected_indices:
+            self.selected_indices.remove(index)
         else:
-            lbl.config(borderwidth=0, relief="flat")
+            self.selected_indices.add(index)
+            # Copy the image (using its file path) to the clipboard
+            self.copy_image_to_clipboard(self.image_paths[index])
+        self._draw_selection()
 
-    def _flow_images(self):
-        for lbl in self.img_labels:
-            lbl.pack_forget()
+    def _draw_selection(self):
+        self.canvas.delete("selection")
+        if self._mosaic_layout is None:
+            return
+        cols, cell_width, y_offsets, scaled_sizes = self._mosaic_layout
+        for index in self.selected_indices:
+            x1 = (index % cols) * cell_width
+            y1 = y_offsets[index // cols]
+            w, h = scaled_sizes[index]
+            self.canvas.create_rectangle(
+                x1 + 2,
+                y1 + 2,
+                x1 + w - 3,
+                y1 + h - 3,
+                outline="black",
+                width=5,
+                tags="selection",
+            )
 
+    def _flow_images(self):
         canvas_width = self.canvas.winfo_width()
         if canvas_width <= 1:
             return
@@ -487,84 +870,108 @@ class LabelingTool(tk.Tk):
         min_img_width = 150
         cols = max(1, canvas_width // min_img_width)
         cell_width = canvas_width // cols
+        if cell_width == self._last_cell_width and len(self.original_images) == len(
+            self._scaled_images
+        ):
+            # Same cell size and same images: the current mosaic is still valid
+            return
 
-        row = 0
-        col = 0
-        new_img_tks = []
-
+        # Layout pass: scaled size of every image and the top of every row.
+        # y_offsets ends with the bottom of the last row.
+        scaled_sizes = []
+        y_offsets = [0]
+        row_max = 0
         for i, pil_img in enumerate(self.original_images):
             w, h = pil_img.size
             ratio = w / h if h != 0 else 1
-            scaled_w = cell_width
-            scaled_h = int(scaled_w / ratio)
-
-            resized_img = pil_img.resize((scaled_w, scaled_h), Image.Resampling.LANCZOS)
-            imgtk = ImageTk.PhotoImage(resized_img)
-
-            lbl = self.img_labels[i]
-            lbl.config(image=imgtk)
-            lbl.image = imgtk
-            new_img_tks.append(imgtk)
-
-            x_pos = col * cell_width
-            y_pos = sum(self._row_heights(row))
-            lbl.place(x=x_pos, y=y_pos, width=scaled_w, height=scaled_h)
-
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
-
-        total_height = 0
-        i = 0
-        row_heights = []
-        while i < len(self.original_images):
-            batch = self.original_images[i : i + cols]
-            heights = []
-            for pil_img in batch:
-                w, h = pil_img.size
-                ratio = w / h if h != 0 else 1
-                scaled_h = int(cell_width / ratio)
-                heights.append(scaled_h)
-            row_heights.append(max(heights) if heights else 0)
-            i += cols
-        total_height = sum(row_heights) + 20
-
-        self.images_frame.config(width=canvas_width, height=total_height)
-        self.canvas.config(scrollregion=(0, 0, canvas_width, total_height))
-        self.img_tks = new_img_tks
+            scaled_h = int(cell_width / ratio)
+            scaled_sizes.append((cell_width, scaled_h))
+            if i > 0 and i % cols == 0:
+                y_offsets.append(y_offsets[-1] + row_max)
+                row_max = 0
+            row_max = max(row_max, scaled_h)
+        if self.original_images:
+            y_offsets.append(y_offsets[-1] + row_max)
+
+        total_height = y_offsets[-1] + 20
+
+        if self.original_images:
+            # Paste every thumbnail into one image so Tk has a single item to draw
+            bg = tuple(c >> 8 for c in self.canvas.winfo_rgb(self.canvas.cget("bg")))
+            mosaic = Image.new("RGB", (canvas_width, y_offsets[-1]), bg)
+            scaled_images = []
+            for i, pil_img in enumerate(self.original_images):
+                resized_img = None
+                if i < len(self._scaled_images):
+                    resized_img = self._scaled_images[i]
+                if resized_img is None or resized_img.size != scaled_sizes[i]:
+                    resized_img = pil_img.resize(scaled_sizes[i], THUMB_RESAMPLE)
+                scaled_images.append(resized_img)
+                mosaic.paste(
+                    resized_img, ((i % cols) * cell_width, y_offsets[i // cols])
+                )
+            self._scaled_images = scaled_images
+            self.mosaic_tk = self._get_photo(mosaic)
+            self._mosaic_layout = (cols, cell_width, y_offsets, scaled_sizes)
+        else:
+            self.mosaic_tk = None
+            self._mosaic_layout = None
+            self._scaled_images = []
+        self._last_cell_width = cell_width
 
-    def _row_heights(self, row_index):
-        canvas_width = self.canvas.winfo_width()
-        min_img_width = 150
-        cols = max(1, canvas_width // min_img_width)
-        cell_width = canvas_width // cols
+        self.canvas.itemconfig(self.mosaic_item, image=self.mosaic_tk or "")
+        self._draw_selection()
+        self.canvas.config(scrollregion=(0, 0, canvas_width, total_height))
 
-        row_heights = []
-        i = 0
-        while i < len(self.original_images):
-            batch = self.original_images[i : i + cols]
-            heights = []
-            for pil_img in batch:
-                w, h = pil_img.size
-                ratio = w / h if h != 0 else 1
-                scaled_h = int(cell_width / ratio)
-                heights.append(scaled_h)
-            row_heights.append(max(heights) if heights else 0)
-            i += cols
-
-        return row_heights[:row_index]
+    def _get_photo(self, pil_img):
+        """
+        Returns a PhotoImage showing pil_img, pasting into a pooled PhotoImage
+        of the same size instead of allocating a new Tk image when possible.
+        """
+        photo = self._photo_pool.get(pil_img.size)
+        if photo is not None:
+            self._photo_pool.move_to_end(pil_img.size)
+            photo.paste(pil_img)
+            return photo
+        photo = ImageTk.PhotoImage(pil_img)
+        self._photo_pool[pil_img.size] = photo
+        if len(self._photo_pool) > PHOTO_POOL_SIZE:
+            self._photo_pool.popitem(last=False)
+        return photo
 
     def _on_canvas_configure(self, event):
+        # Only the width affects the layout; a resize storm is coalesced
+        # into one reflow when Tk goes idle
+        if event.width == self._last_canvas_width:
+            return
+        self._last_canvas_width = event.width
+        if self._reflow_pending:
+            return
+        self._reflow_pending = True
+        self.after_idle(self._do_reflow)
+
+    def _do_reflow(self):
+        self._reflow_pending = False
         self._flow_images()
 
     # ==========================
     #  PROGRESS BAR
     # ==========================
 
+    @staticmethod
+    def _label_color(age):
+        try:
+            # Convert age to float and check if it's -1 (skipped)
+            if float(age) == -1:
+                return "yellow"
+            return "green"
+        except ValueError:
+            return "black"
+
     def _draw_progress_bar(self):
         self.progress_canvas.delete("all")
-        self.track_rects.clear()
+        self._rect_by_index.clear()
+        self._progress_marked_index = None
 
         if self.n_tracks == 0:
             return
@@ -577,40 +984,65 @@ class LabelingTool(tk.Tk):
 
         rect_width = canvas_width / self.n_tracks
 
+        track_color = self._track_color
         for i, (cam, tid, _) in enumerate(self.tracks):
             x1 = int(i * rect_width)
             x2 = int((i + 1) * rect_width)
-            if (cam, tid) in self.labeled_data:
-                gender, age = self.labeled_data[(cam, tid)]
-                try:
-                    # Convert age to float and check if it's -1 (skipped)
-                    if float(age) == -1:
-                        fill_color = "yellow"
-                    else:
-                        fill_color = "green"
-                except ValueError:
-                    fill_color = "black"
-            else:
-                fill_color = "black"
+            fill_color = track_color.get((cam, tid), "black")
 
             rect_id = self.progress_canvas.create_rectangle(
                 x1, y1, x2, y2, fill=fill_color, outline=fill_color, width=0
             )
             if i == self.current_track_index:
                 self.progress_canvas.itemconfig(rect_id, outline="red", width=2)
+                self._progress_marked_index = i
+
+            self._rect_by_index.append(rect_id)
 
-            self.track_rects.append((rect_id, x1, y1, x2, y2, i))
+    def _update_progress_cell(self, i):
+        """Recolors the rectangle of track i after its label or selection changed."""
+        if not (0 <= i < len(self._rect_by_index)):
+            return
+        cam, tid, _ = self.tracks[i]
+        fill_color = self._track_color.get((cam, tid), "black")
+        if i == self.current_track_index:
+            outline, width = "red", 2
+        else:
+            outline, width = fill_color, 0
+        self.progress_canvas.itemconfig(
+            self._rect_by_index[i], fill=fill_color, outline=outline, width=width
+        )
+
+    def _update_progress_marker(self):
+        """Moves the red outline from the previously shown track to the current one."""
+        previous = self._progress_marked_index
+        self._progress_marked_index = self.current_track_index
+        if previous is not None and previous != self.current_track_index:
+            self._update_progress_cell(previous)
+        self._update_progress_cell(self.current_track_index)
 
     def _on_progress_canvas_configure(self, event):
+        size = (event.width, event.height)
+        if size == self._last_progress_size:
+            return
+        self._last_progress_size = size
+        if self._progress_redraw_pending:
+            return
+        self._progress_redraw_pending = True
+        self.after_idle(self._do_progress_redraw)
+
+    def _do_progress_redraw(self):
+        self._progress_redraw_pending = False
         self._draw_progress_bar()
 
     def _on_progress_click(self, event):
-        x, y = event.x, event.y
-        for rect_id, x1, y1, x2, y2, track_i in self.track_rects:
-            if x1 <= x <= x2 and y1 <= y <= y2:
-                self.current_track_index = track_i
-                self.display_current_track()
-                break
+        canvas_width = self.progress_canvas.winfo_width()
+        if self.n_tracks == 0 or canvas_width <= 0:
+            return
+        # Cells are equally wide, so the track index follows directly from x
+        idx = int(event.x * self.n_tracks / canvas_width)
+        self.current_track_index = min(self.n_tracks - 1, max(0, idx))
+        self.display_current_track()
 
     # ==========================
     #  "Go to Track" method
@@ -685,34 +1117,77 @@ class LabelingTool(tk.Tk):
             age_str = "-1"
         else:
             age_str = str(age)
+        if (cam, tid) in self.labeled_data:
+            # Older row stays in the file until the next consolidation
+            self._csv_dirty = True
         self.labeled_data[(cam, tid)] = (gender, age_str)
-        with open(self.output_csv, "w", newline="", encoding="utf-8") as f:
+        self._track_color[(cam, tid)] = self._label_color(age_str)
+        self._csv_writer.writerow([cam, tid, gender, age_str])
+        self._csv_fh.flush()
+        self._update_progress_cell(self.current_track_index)
+
+    def _rewrite_csv(self):
+        """Rewrites the whole CSV from labeled_data and reopens it for appending."""
+        self._csv_fh.close()
+        rows = [(c, t, g, a) for (c, t), (g, a) in self.labeled_data.items()]
+        # Write next to the CSV and swap it in, so a crash never leaves it empty
+        tmp_path = self.output_csv + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(["camera_id", "track_id", "gender", "age"])
-            for (c, t), (g, a) in self.labeled_data.items():
-                writer.writerow([c, t, g, a])
+            writer.writerows(rows)
+        os.replace(tmp_path, self.output_csv)
+        self._csv_fh = open(self.output_csv, "a", newline="", encoding="utf-8")
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_dirty = False
+
+    def _close_csv(self):
+        """Drops duplicate rows left by re-saved tracks and closes the CSV."""
+        if self._csv_fh.closed:
+            return
+        if self._csv_dirty:
+            self._rewrite_csv()
+        self._csv_fh.close()
+
+    def _on_close(self):
+        self._close_csv()
+        self._cancel_prefetch()
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._decode_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
     def show_distribution(self):
-        import matplotlib.pyplot as plt
+        if _plt is None:
+            messagebox.showerror(
+                "Error", "matplotlib is required to show the distribution."
+            )
+            return
 
-        ages = []
-        gender_counts = {"male": 0, "female": 0}
-        for (cam, tid), (gender, age_str) in self.labeled_data.items():
-            try:
-                age_val = float(age_str)
-                if 0 < age_val < 101:
-                    ages.append(age_val)
-            except ValueError:
-                continue
-            if gender in gender_counts:
-                gender_counts[gender] += 1
+        labels = list(self.labeled_data.values())
+        all_ages = np.fromiter(
+            (_parse_age(a) for _, a in labels), dtype=np.float32, count=len(labels)
+        )
+        parsed = ~np.isnan(all_ages)
+        ages = all_ages[parsed & (all_ages > 0) & (all_ages < 101)]
+
+        # Genders are counted for every label with a numeric age, skips included
+        genders = np.array([g for g, _ in labels], dtype=object)
+        gender_counts = {
+            g: int(np.count_nonzero(parsed & (genders == g)))
+            for g in ("male", "female")
+        }
 
-        if not ages:
+        if ages.size == 0:
             messagebox.showinfo("Info", "No labeled data available for plotting.")
             return
 
-        fig, axs = plt.subplots(1, 2, figsize=(10, 4))
-        axs[0].hist(ages, bins=range(int(min(ages)), int(max(ages)) + 2))
+        if self._dist_fig is None or not _plt.fignum_exists(self._dist_fig.number):
+            self._dist_fig, self._dist_axes = _plt.subplots(1, 2, figsize=(10, 4))
+        else:
+            for ax in self._dist_axes:
+                ax.cla()
+        axs = self._dist_axes
+        axs[0].hist(ages, bins=np.arange(int(ages.min()), int(ages.max()) + 2))
         axs[0].set_title("Age Distribution")
         axs[0].set_xlabel("Age")
         axs[0].set_ylabel("Count")
@@ -722,8 +1197,9 @@ class LabelingTool(tk.Tk):
         axs[1].set_xlabel("Gender")
         axs[1].set_ylabel("Count")
 
-        plt.tight_layout()
-        plt.show()
+        self._dist_fig.tight_layout()
+        self._dist_fig.canvas.draw_idle()
+        _plt.show()
 
 
 def main():